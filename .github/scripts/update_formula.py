@@ -6,6 +6,8 @@ import re
 import sys
 from pathlib import Path
 
+_FIELD_PATTERN = re.compile(r'(url|sha256|version)(\s+")([^"]+)(")')
+
 
 def main() -> int:
     if len(sys.argv) != 5:
@@ -21,20 +23,26 @@ def main() -> int:
     sha = sys.argv[4]
 
     text = formula_path.read_text()
-    replacements = [
-        (r'(url\s+")([^"]+)(")', f'\\g<1>{download_url}\\g<3>'),
-        (r'(sha256\s+")([^"]+)(")', f'\\g<1>{sha}\\g<3>'),
-        (r'(version\s+")([^"]+)(")', f'\\g<1>{version}\\g<3>'),
-    ]
-
-    for pattern, replacement in replacements:
-        new_text, count = re.subn(pattern, replacement, text, count=1)
-        if count == 0:
-            print(f"Failed to update pattern: {pattern}", file=sys.stderr)
+    values = {"url": download_url, "sha256": sha, "version": version}
+    updated: set[str] = set()
+
+    def replace(match: re.Match[str]) -> str:
+        field = match.group(1)
+        # Only the first occurrence of each field is rewritten.
+        if field in updated:
+            return match.group(0)
+        updated.add(field)
+        return f"{field}{match.group(2)}{values[field]}{match.group(4)}"
+
+    new_text = _FIELD_PATTERN.sub(replace, text)
+    for field in values:
+        if field not in updated:
+            print(f"Failed to update field: {field}", file=sys.stderr)
             return 1
-        text = new_text
 
-    formula_path.write_text(text)
+    # Leave the file (and its mtime) untouched when the formula is already current.
+    if new_text != text:
+        formula_path.write_text(new_text)
     return 0
 
 
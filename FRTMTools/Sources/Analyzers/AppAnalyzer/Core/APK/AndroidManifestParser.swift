@@ -145,10 +145,13 @@ private func deepLinks(from component: AndroidComponentInfo) -> [AndroidDeepLink
 
 enum AndroidManifestParser {
     static func parse(from url: URL) -> AndroidManifestInfo? {
-        guard let data = try? Data(contentsOf: url) else { return nil }
+        guard let data = try? Data(contentsOf: url, options: .mappedIfSafe) else { return nil }
+
+        // Binary AXML opens with a RES_XML_TYPE chunk header, so skip decoding it as text.
+        let isBinaryXML = data.starts(with: [0x03, 0x00])
 
         // AXML can sometimes be in a text format, handle that first.
-        if let text = String(data: data, encoding: .utf8), text.trimmingCharacters(in: .whitespacesAndNewlines).starts(with: "<") {
+        if !isBinaryXML, let text = String(data: data, encoding: .utf8), text.trimmingCharacters(in: .whitespacesAndNewlines).starts(with: "<") {
             return parseTextManifest(text)
         }
 
@@ -399,21 +402,18 @@ private struct AndroidBinaryXMLParser {
     // MARK: - Chunk Parsers
     private mutating func parseStringPool(header: ChunkHeader) {
         let chunkStart = offset
-        guard let stringCount = readUInt32(at: chunkStart + 8),
-              let styleCount = readUInt32(at: chunkStart + 12),
-              let flags = readUInt32(at: chunkStart + 16),
-              let stringsStart = readUInt32(at: chunkStart + 20),
-              let stylesStart = readUInt32(at: chunkStart + 24)
-        else { return }
+        guard let poolHeader = StringPoolHeader(data: data, chunkStart: chunkStart) else { return }
 
-        let isUTF8 = (flags & 0x00000100) != 0
+        let isUTF8 = poolHeader.isUTF8
         let offsetsStart = chunkStart + header.headerSize
+        let chunkLimit = min(chunkStart + header.chunkSize, data.count)
         
+        let stringOffsets = poolHeader.stringOffsets(in: data, from: offsetsStart, limit: data.count)
         var pool: [String] = []
-        for i in 0..<Int(stringCount) {
-            guard let strOffset = readUInt32(at: offsetsStart + (i * 4)) else { continue }
-            let absolute = chunkStart + Int(stringsStart) + Int(strOffset)
-            if let string = readString(at: absolute, isUTF8: isUTF8) {
+        pool.reserveCapacity(stringOffsets.count)
+        for strOffset in stringOffsets {
+            let absolute = chunkStart + poolHeader.stringsStart + strOffset
+            if let string = readString(at: absolute, isUTF8: isUTF8, limit: chunkLimit) {
                 pool.append(string)
             } else {
                 pool.append("")
@@ -653,8 +653,9 @@ private struct AndroidBinaryXMLParser {
         return data.withUnsafeBytes { $0.load(fromByteOffset: offset, as: UInt32.self).littleEndian }
     }
 
-    private func readString(at position: Int, isUTF8: Bool) -> String? {
-        guard position < data.count else { return nil }
+    /// Reads a pool string, never looking past `limit` (the end of the string pool chunk).
+    private func readString(at position: Int, isUTF8: Bool, limit: Int) -> String? {
+        guard position < limit else { return nil }
         if isUTF8 {
             // UTF-8 strings are encoded with two lengths:
             // 1. The length in UTF-16 characters.
@@ -662,17 +663,17 @@ private struct AndroidBinaryXMLParser {
             let (charLen, charBytes) = readVarint(at: position)
             let (byteLen, byteBytes) = readVarint(at: position + charBytes)
             let start = position + charBytes + byteBytes
-            let end = min(start + byteLen, data.count)
-            guard start <= end, data[end] == 0x00 else { return nil } // Null-terminated
-            let slice = data.subdata(in: start..<end)
+            let end = min(start + byteLen, limit)
+            guard start <= end, end < limit, data[end] == 0x00 else { return nil } // Null-terminated
+            let slice = data[start..<end]
             return String(data: slice, encoding: .utf8)
         } else { // UTF-16
             let (len, lenBytes) = readVarint16(at: position)
             let start = position + lenBytes
             let byteLength = len * 2
-            let end = min(start + byteLength, data.count)
-            guard start <= end, readUInt16(at: end) == 0x0000 else { return nil } // Null-terminated
-            let slice = data.subdata(in: start..<end)
+            let end = min(start + byteLength, limit)
+            guard start <= end, end + 1 < limit, readUInt16(at: end) == 0x0000 else { return nil } // Null-terminated
+            let slice = data[start..<end]
             return String(data: slice, encoding: .utf16LittleEndian)
         }
     }
@@ -704,17 +705,57 @@ private struct ChunkHeader {
     let chunkSize: Int
 }
 
+private struct StringPoolHeader {
+    let stringCount: Int
+    let styleCount: Int
+    let flags: UInt32
+    let stringsStart: Int
+    let stylesStart: Int
+
+    var isUTF8: Bool { (flags & 0x00000100) != 0 }
+
+    /// Reads the fixed-size string pool header with a single bounds check and buffer access.
+    init?(data: Data, chunkStart: Int) {
+        guard chunkStart >= 0, chunkStart + 28 <= data.count else { return nil }
+        let fields = data.withUnsafeBytes { pointer in
+            func field(_ relativeOffset: Int) -> UInt32 {
+                pointer.load(fromByteOffset: chunkStart + relativeOffset, as: UInt32.self).littleEndian
+            }
+            return (field(8), field(12), field(16), field(20), field(24))
+        }
+        stringCount = Int(fields.0)
+        styleCount = Int(fields.1)
+        flags = fields.2
+        stringsStart = Int(fields.3)
+        stylesStart = Int(fields.4)
+    }
+
+    /// Decodes the whole string offset table in one buffer access, dropping entries past `limit`.
+    func stringOffsets(in data: Data, from offsetsStart: Int, limit: Int) -> [Int] {
+        let available = max(0, (min(limit, data.count) - offsetsStart) / 4)
+        let count = min(stringCount, available)
+        guard count > 0 else { return [] }
+        return data.withUnsafeBytes { pointer in
+            (0..<count).map { index in
+                Int(pointer.load(fromByteOffset: offsetsStart + (index * 4), as: UInt32.self).littleEndian)
+            }
+        }
+    }
+}
+
 // MARK: - Resilient Fallback Parser
 
 private struct AndroidStringPoolHeuristicParser {
     private let data: Data
-    private let allowedPackageCharacters = CharacterSet(charactersIn: "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789._")
-    private let labelExclusions: Set<String> = [
+    private static let allowedPackageCharacters = CharacterSet(charactersIn: "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789._")
+    private static let labelExclusions: Set<String> = [
         "name","label","application","activity","service","receiver","provider","release","debug","main",
         "version","sdk","min","max","target","true","false","null","value","config","default","string",
         "layout","drawable","color","dimen","style","array","integer","bool","id","attr","anim","menu",
         "raw","xml","font","navigation","transition"
     ]
+    private static let componentSuffixes = ["activity", "service", "receiver", "provider"]
+    private static let labelExcludedPrefixes = ["android", "com."]
 
     init(data: Data) {
         self.data = data
@@ -727,24 +768,27 @@ private struct AndroidStringPoolHeuristicParser {
 
         var info = AndroidManifestInfo()
         var permissionSet: Set<String> = []
-        var versionCodeCandidate: String?
+        var versionCodeCandidate: (value: String, number: Int)?
         var versionNameCandidate: String?
         var packageCandidates: [String] = []
+        var permissionOwners: [String] = []
+        var minSDKIndex: Int?
+        var targetSDKIndex: Int?
+        var applicationIndex: Int?
 
-        for string in strings {
+        for (index, string) in strings.enumerated() {
             if looksLikePermission(string) {
                 permissionSet.insert(string)
             }
 
-            if looksLikeVersionCode(string) {
-                if let existing = versionCodeCandidate,
-                   let existingInt = Int(existing),
-                   let candidateInt = Int(string),
-                   candidateInt > existingInt {
-                    versionCodeCandidate = string
-                } else if versionCodeCandidate == nil {
-                    versionCodeCandidate = string
-                }
+            if let owner = permissionOwner(from: string) {
+                permissionOwners.append(owner)
+            }
+
+            if looksLikeVersionCode(string),
+               let number = Int(string),
+               number > (versionCodeCandidate?.number ?? -1) {
+                versionCodeCandidate = (string, number)
             }
 
             if versionNameCandidate == nil, looksLikeVersionName(string) {
@@ -754,15 +798,25 @@ private struct AndroidStringPoolHeuristicParser {
             if looksLikePackageCandidate(string) {
                 packageCandidates.append(string)
             }
+
+            if minSDKIndex == nil, string.caseInsensitiveCompare("minSdkVersion") == .orderedSame {
+                minSDKIndex = index
+            }
+            if targetSDKIndex == nil, string.caseInsensitiveCompare("targetSdkVersion") == .orderedSame {
+                targetSDKIndex = index
+            }
+            if applicationIndex == nil, string == "application" {
+                applicationIndex = index
+            }
         }
 
         info.permissions = Array(permissionSet).sorted()
-        info.versionCode = versionCodeCandidate
+        info.versionCode = versionCodeCandidate?.value
         info.versionName = versionNameCandidate
-        info.packageName = bestPackageName(from: packageCandidates, in: strings) ?? packageCandidates.first
-        info.minSDK = value(nearKeyword: "minSdkVersion", in: strings)
-        info.targetSDK = value(nearKeyword: "targetSdkVersion", in: strings)
-        info.appLabel = inferAppLabel(from: strings)
+        info.packageName = bestPackageName(from: packageCandidates, permissionOwners: permissionOwners, in: strings) ?? packageCandidates.first
+        info.minSDK = numericValue(after: minSDKIndex, in: strings)
+        info.targetSDK = numericValue(after: targetSDKIndex, in: strings)
+        info.appLabel = inferAppLabel(from: strings, applicationIndex: applicationIndex)
 
         let hasUsefulData = info.packageName != nil
             || info.versionName != nil
@@ -809,26 +863,18 @@ private struct AndroidStringPoolHeuristicParser {
     }
 
     private func parseStringPool(at offset: Int, headerSize: Int, chunkSize: Int) -> [String] {
-        guard let stringCount = readUInt32(at: offset + 8),
-              let flags = readUInt32(at: offset + 16),
-              let stringsStart = readUInt32(at: offset + 20)
-        else { return [] }
+        guard let poolHeader = StringPoolHeader(data: data, chunkStart: offset) else { return [] }
 
-        let isUTF8 = (flags & 0x00000100) != 0
+        let isUTF8 = poolHeader.isUTF8
         let offsetsStart = offset + headerSize
         let chunkLimit = min(offset + Int(chunkSize), data.count)
 
+        let stringOffsets = poolHeader.stringOffsets(in: data, from: offsetsStart, limit: chunkLimit)
         var results: [String] = []
-        results.reserveCapacity(Int(stringCount))
-
-        for index in 0..<Int(stringCount) {
-            let offsetLocation = offsetsStart + (index * 4)
-            guard offsetLocation + 3 < chunkLimit,
-                  let strOffset = readUInt32(at: offsetLocation)
-            else {
-                continue
-            }
-            let absolute = offset + Int(stringsStart) + Int(strOffset)
+        results.reserveCapacity(stringOffsets.count)
+
+        for strOffset in stringOffsets {
+            let absolute = offset + poolHeader.stringsStart + strOffset
             if let string = readString(at: absolute, isUTF8: isUTF8, limit: chunkLimit), !string.isEmpty {
                 results.append(string)
             }
@@ -847,7 +893,7 @@ private struct AndroidStringPoolHeuristicParser {
             let start = position + utf16Bytes + byteBytes
             let end = start + byteLength
             guard start < end, end <= limit, end <= data.count else { return nil }
-            let slice = data.subdata(in: start..<end)
+            let slice = data[start..<end]
             return String(data: slice, encoding: .utf8)
         } else {
             let (len, lenBytes) = readVarint16(at: position)
@@ -855,7 +901,7 @@ private struct AndroidStringPoolHeuristicParser {
             let start = position + lenBytes
             let end = start + (len * 2)
             guard start < end, end <= limit, end <= data.count else { return nil }
-            let slice = data.subdata(in: start..<end)
+            let slice = data[start..<end]
             return String(data: slice, encoding: .utf16LittleEndian)
         }
     }
@@ -868,12 +914,11 @@ private struct AndroidStringPoolHeuristicParser {
         guard components.count >= 2 else { return false }
         guard !value.hasPrefix("android.permission.") else { return false }
         guard let first = value.first, first.isLetter || first == "_" else { return false }
-        return value.unicodeScalars.allSatisfy { allowedPackageCharacters.contains($0) }
+        return value.unicodeScalars.allSatisfy { Self.allowedPackageCharacters.contains($0) }
     }
 
-    private func bestPackageName(from candidates: [String], in strings: [String]) -> String? {
+    private func bestPackageName(from candidates: [String], permissionOwners: [String], in strings: [String]) -> String? {
         guard !candidates.isEmpty else { return nil }
-        let permissionOwners = strings.compactMap(permissionOwner(from:))
         var best: (name: String, score: Int)?
 
         for candidate in candidates {
@@ -923,22 +968,18 @@ private struct AndroidStringPoolHeuristicParser {
     }
 
     private func looksLikeVersionName(_ value: String) -> Bool {
-        guard value.count <= 60, (value.contains(".") || value.contains("-")) else { return false }
         guard let first = value.first, first.isNumber else { return false }
-        let filtered = value
-            .replacingOccurrences(of: ".", with: "")
-            .replacingOccurrences(of: "-", with: "")
-            .replacingOccurrences(of: "_", with: "")
-            .lowercased()
-            .replacingOccurrences(of: "rc", with: "")
-            .replacingOccurrences(of: "beta", with: "")
-            .replacingOccurrences(of: "alpha", with: "")
-        return filtered.first?.isNumber == true
+        return value.count <= 60 && (value.contains(".") || value.contains("-"))
     }
 
     private func looksLikeVersionCode(_ value: String) -> Bool {
-        guard value.count >= 3, value.count <= 12 else { return false }
-        return value.allSatisfy(\.isNumber)
+        let length = value.utf8.count
+        guard length >= 3, length <= 12 else { return false }
+        return isASCIIDigits(value)
+    }
+
+    private func isASCIIDigits(_ value: String) -> Bool {
+        value.utf8.allSatisfy { $0 >= 0x30 && $0 <= 0x39 }
     }
 
     private func looksLikePermission(_ value: String) -> Bool {
@@ -947,23 +988,30 @@ private struct AndroidStringPoolHeuristicParser {
         }
         if let range = value.range(of: ".permission.", options: .caseInsensitive) {
             let suffix = value[range.upperBound...].lowercased()
-            return !suffix.hasSuffix("activity") && !suffix.hasSuffix("service") && !suffix.hasSuffix("receiver") && !suffix.hasSuffix("provider")
+            return !Self.componentSuffixes.contains { suffix.hasSuffix($0) }
         }
         return false
     }
 
-    private func inferAppLabel(from strings: [String]) -> String? {
-        if let applicationIndex = strings.firstIndex(of: "application") {
+    private func inferAppLabel(from strings: [String], applicationIndex: Int?) -> String? {
+        if let applicationIndex {
             if let local = labelCandidate(around: applicationIndex, in: strings) {
                 return local
             }
         }
 
-        if let spaced = strings.first(where: { isLabelCandidate($0, preferSpaces: true) }) {
-            return spaced
+        // Prefer the first multi-word label; otherwise fall back to the first single-word one.
+        var firstCandidate: String?
+        for string in strings {
+            guard let trimmed = labelCandidateText(string) else { continue }
+            if trimmed.contains(" ") {
+                return string
+            }
+            if firstCandidate == nil {
+                firstCandidate = string
+            }
         }
-
-        return strings.first(where: { isLabelCandidate($0, preferSpaces: false) })
+        return firstCandidate
     }
 
     private func labelCandidate(around index: Int, in strings: [String]) -> String? {
@@ -971,38 +1019,35 @@ private struct AndroidStringPoolHeuristicParser {
         let upperBound = min(strings.count, index + 25)
         for idx in lowerBound..<upperBound where idx != index {
             let candidate = strings[idx]
-            if isLabelCandidate(candidate, preferSpaces: true) {
+            if labelCandidateText(candidate)?.contains(" ") == true {
                 return candidate
             }
         }
         return nil
     }
 
-    private func isLabelCandidate(_ value: String, preferSpaces: Bool) -> Bool {
+    /// Returns the trimmed value if it passes the label filters, so callers only need to check for spaces.
+    private func labelCandidateText(_ value: String) -> String? {
         let trimmed = value.trimmingCharacters(in: .whitespacesAndNewlines)
-        guard trimmed.count >= 2, trimmed.count <= 60 else { return false }
+        guard trimmed.count >= 2, trimmed.count <= 60 else { return nil }
         let lower = trimmed.lowercased()
-        if labelExclusions.contains(lower) { return false }
-        if trimmed.contains("/") || trimmed.contains("@") { return false }
-        if trimmed.hasPrefix("android") || trimmed.hasPrefix("com.") { return false }
-        if trimmed.lowercased().hasSuffix(".xml") { return false }
-        if trimmed.rangeOfCharacter(from: .decimalDigits) != nil { return false }
-        if trimmed.contains(".") && !trimmed.contains(" ") { return false }
-        if preferSpaces {
-            return trimmed.contains(" ") && trimmed.first?.isUppercase == true
-        }
-        return trimmed.first?.isUppercase == true
+        if Self.labelExclusions.contains(lower) { return nil }
+        if trimmed.contains("/") || trimmed.contains("@") { return nil }
+        if Self.labelExcludedPrefixes.contains(where: { trimmed.hasPrefix($0) }) { return nil }
+        if lower.hasSuffix(".xml") { return nil }
+        if trimmed.rangeOfCharacter(from: .decimalDigits) != nil { return nil }
+        if trimmed.contains(".") && !trimmed.contains(" ") { return nil }
+        guard trimmed.first?.isUppercase == true else { return nil }
+        return trimmed
     }
 
-    private func value(nearKeyword keyword: String, in strings: [String]) -> String? {
-        guard let index = strings.firstIndex(where: { $0.caseInsensitiveCompare(keyword) == .orderedSame }) else {
-            return nil
-        }
+    private func numericValue(after keywordIndex: Int?, in strings: [String]) -> String? {
+        guard let index = keywordIndex else { return nil }
 
         let searchRange = (index + 1)..<min(strings.count, index + 6)
         for idx in searchRange {
             let candidate = strings[idx]
-            if candidate.allSatisfy(\.isNumber) {
+            if isASCIIDigits(candidate) {
                 return candidate
             }
         }